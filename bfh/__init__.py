@@ -4,8 +4,20 @@ BFH: a library for mapping schemas to other schemas.
 """
 from __future__ import absolute_import
 
+import re
+from itertools import chain
+from keyword import iskeyword
+
+import six
+from six.moves import intern
+
 from .common import nullish, dedunder
-from .interfaces import SchemaInterface, MappingInterface
+from .interfaces import (
+    MappingInterface,
+    SchemaInterface,
+    is_schema,
+    is_transformation,
+)
 
 from . import exceptions
 from . import fields
@@ -23,23 +35,158 @@ __all__ = [
 ]
 
 
+def _is_sequence(value):
+    value_type = type(value)
+    return (value_type is list or value_type is tuple
+            or isinstance(value, (list, tuple)))
+
+
+# True if a type has a `serialize` method, False if none of its values can,
+# None if each value has to be asked (it may get one from its own __dict__ or
+# from __getattr__).
+_SERIALIZABLE_TYPES = {}
+
+
+def _is_serializable(value):
+    """
+    Does this value have a `serialize` method? Cached per type where the
+    answer can't vary from value to value.
+
+    """
+    value_type = type(value)
+    try:
+        result = _SERIALIZABLE_TYPES[value_type]
+    except KeyError:
+        if hasattr(value_type, "serialize"):
+            result = True
+        elif hasattr(value, "__dict__") or hasattr(value_type, "__getattr__"):
+            result = None
+        else:
+            result = False
+        _SERIALIZABLE_TYPES[value_type] = result
+    if result is None:
+        return hasattr(value, "serialize")
+    return result
+
+
 def _get_raw_value(value):
     """
-    Helper to recurse within a schema structure
+    Helper to descend within a schema structure
 
     """
-    if isinstance(value, SchemaInterface):
+    if is_schema(value):
         return value._raw
 
-    elif isinstance(value, (list, tuple)):
-        result = []
-        for i in value:
-            result.append(_get_raw_value(i))
-        return result
-
-    else:
+    elif not _is_sequence(value):
         return value
 
+    # walk nested lists with an explicit stack rather than recursion
+    result = []
+    stack = [(value, result)]
+    while stack:
+        items, out = stack.pop()
+        for item in items:
+            if is_schema(item):
+                out.append(item._raw)
+            elif _is_sequence(item):
+                child = []
+                out.append(child)
+                stack.append((item, child))
+            else:
+                out.append(item)
+    return result
+
+
+# Exact types that serialize as themselves and are never nullish.
+_SCALAR_TYPES = frozenset(
+    (bool, float, six.text_type, six.binary_type) + six.integer_types)
+
+
+def _serialize_scalar(value, implicit_nulls=False):
+    return value
+
+
+def _serialize_none(value, implicit_nulls=False):
+    return None
+
+
+def _serialize_dict(value, implicit_nulls=False):
+    if implicit_nulls and not value:
+        return None
+    return value
+
+
+def _serialize_list(value, implicit_nulls=False):
+    items = _serialize_sequence(value, implicit_nulls=implicit_nulls)
+    if implicit_nulls and not items:
+        return None
+    return items
+
+
+# Serializers for the builtin types, by exact type. Anything else (schemas,
+# subclasses of builtins) takes the general path.
+_SERIALIZE_DISPATCH = dict.fromkeys(_SCALAR_TYPES, _serialize_scalar)
+_SERIALIZE_DISPATCH.update({
+    type(None): _serialize_none,
+    dict: _serialize_dict,
+    list: _serialize_list,
+    tuple: _serialize_list,
+})
+
+
+def _serialize_sequence(value, implicit_nulls=False):
+    """
+    Serialize each item of a list or tuple, descending into nested lists, and
+    drop the nullish ones.
+
+    """
+    result = []
+    stack = [(iter(value), result)]
+    while stack:
+        items, out = stack[-1]
+        for item in items:
+            if type(item) in _SCALAR_TYPES:
+                out.append(item)
+                continue
+
+            if _is_serializable(item):
+                item = item.serialize(implicit_nulls=implicit_nulls)
+
+            if _is_sequence(item):
+                # finish the nested list before carrying on with this one
+                stack.append((iter(item), []))
+                break
+
+            if not nullish(item, implicit_nulls=implicit_nulls):
+                out.append(item)
+        else:
+            stack.pop()
+            if stack and (out or not implicit_nulls):
+                stack[-1][1].append(out)
+    return result
+
+
+def _field_serializer(field):
+    """
+    The function `Schema.serialize` should run a field's values through, or
+    None if it would just hand them back, as the stock `Field.serialize`
+    does.
+
+    """
+    plain = six.get_unbound_function(fields.Field.serialize)
+    serialize = getattr(type(field), "serialize", None)
+    if serialize is None or six.get_unbound_function(serialize) is plain:
+        return None
+    return field.serialize
+
+
+def _dedunder_setattr(self, name, value):
+    """
+    Set an attribute, undoing python's name mangling on the way.
+
+    """
+    object.__setattr__(self, dedunder(name), value)
+
 
 class Schema(SchemaInterface):
     """
@@ -69,29 +216,383 @@ class Schema(SchemaInterface):
             return self.__init__(**dict(args[0], **kwargs))
 
         # stash raw kwargs for downstream
-        self._raw_input = kwargs
+        d = self.__dict__
+        d["_raw_input"] = kwargs
 
         # init any subschemas
-        for k, v in self._fields.items():
-            if isinstance(v, fields.Subschema):
-                setattr(self, k, v.subschema_class())
+        for name, subschema_class in self._subschema_fields:
+            d[name] = subschema_class()
 
         # init values passed as kwargs
-        for k, v in kwargs.items():
-            if k.startswith("__"):
-                k = k.strip("_")
+        self._set_inputs(kwargs.items())
 
-            if k in self._field_names:
-                setattr(self, k, v)
+    def _set_inputs(self, items):
+        """
+        Assign (name, value) pairs of input to fields, accepting "__name"
+        for "name". Unknown names are ignored.
 
-    def __setattr__(self, name, value):
-        name = dedunder(name)
-        object.__setattr__(self, name, value)
+        """
+        d = self.__dict__
+        input_names = self._input_names
+        coerced_names = self._coerced_names
+        for k, v in items:
+            name = input_names.get(k)
+            if name is None:
+                if not (isinstance(k, six.string_types) and
+                        k.startswith("__")):
+                    continue
+                name = input_names.get(k.strip("_"))
+                if name is None:
+                    continue
+
+            if name in coerced_names:
+                setattr(self, name, v)
+            else:
+                d[name] = v
+
+    @classmethod
+    def _finalize_class(cls):
+        """
+        Precompute the lookups `__init__` needs for this schema's fields,
+        and generate an `__init__` that uses them.
+
+        """
+        plain_set = six.get_unbound_function(fields.Field.__set__)
+        cls._subschema_fields = tuple(
+            (name, field.subschema_class)
+            for name, field in cls._field_items
+            if isinstance(field, fields.Subschema)
+        )
+
+        # only schemas with fields declared as "__name" need mangled names
+        # undone on every set; the rest use plain attribute assignment.
+        setter = next(vars(klass)["__setattr__"] for klass in cls.__mro__
+                      if "__setattr__" in vars(klass))
+        custom_setattr = setter not in (_dedunder_setattr,
+                                        object.__dict__["__setattr__"])
+        if cls._fields and not custom_setattr:
+            if any(getattr(cls, name, None) is not field
+                   for name, field in cls._field_items):
+                cls.__setattr__ = _dedunder_setattr
+            else:
+                cls.__setattr__ = object.__setattr__
+
+        cls._serialize_plan = tuple(
+            (name, _field_serializer(field))
+            for name, field in cls._field_items
+        )
+
+        # accept both "name" and "__name" for every field
+        cls._input_names = {}
+        for name in cls._field_names:
+            cls._input_names[name] = name
+            cls._input_names[intern("__" + name)] = name
+
+        # fields whose descriptor does something on set (like coercing dicts
+        # into subschemas) have to go through setattr; the rest can be
+        # written straight into the instance dict. A hand-written
+        # __setattr__ has to see every field.
+        if custom_setattr:
+            cls._coerced_names = frozenset(cls._field_names)
+        else:
+            cls._coerced_names = frozenset(
+                name for name, field in cls._field_items
+                if getattr(cls, name, None) is field
+                and six.get_unbound_function(
+                    getattr(type(field), "__set__", plain_set)) is not plain_set
+            )
+
+        cls._compile_init()
+        cls._compile_validate()
+        cls._compile_serialize()
+
+    @classmethod
+    def _compile_validate(cls):
+        """
+        Generate a `validate` specialized to this schema's fields.
+
+        Fields that only check a type, like `IntegerField`, get that check
+        written out inline; the field's own `validate` runs only when the
+        check fails, to raise its error (or, for a `UnicodeField`, to try
+        decoding the value). Every other field's `validate` is called as
+        usual.
+        """
+        if "validate" in vars(cls):
+            # declared in the class body; leave hand-written validates alone
+            return
+        generic = Schema.__dict__["validate"]
+        validate = six.get_unbound_function(cls.validate)
+        if validate is not generic and not getattr(validate, "compiled",
+                                                   False):
+            return
+
+        # a string passes UnicodeField.validate exactly as the plain type
+        # check would, so it can be inlined the same way
+        type_checks = (
+            six.get_unbound_function(fields.SimpleTypeField.validate),
+            six.get_unbound_function(fields.UnicodeField.validate),
+        )
+        namespace = {}
+        lines = ["d = self.__dict__"]
+        for i, (name, field) in enumerate(cls._field_items):
+            namespace["_v%d" % i] = field.validate
+            lines.extend([
+                "value = d.get(%r)" % name,
+                "if value is None:",
+                "    value = getattr(self, %r)" % name,
+            ])
+            field_validate = getattr(type(field), "validate", None)
+            if (field_validate is not None and
+                    six.get_unbound_function(field_validate) in type_checks):
+                namespace["_type%d" % i] = field.field_type
+                namespace["_f%d" % i] = field
+                # required is read on every call; it may change after the
+                # class is built
+                ok = ("isinstance(value, _type%d) or "
+                      "(value is None and not _f%d.required)" % (i, i))
+                lines.extend([
+                    "if not (%s) and not _v%d(value):" % (ok, i),
+                    "    return False",
+                ])
+            else:
+                lines.extend([
+                    "if not _v%d(value):" % i,
+                    "    return False",
+                ])
+
+        src = VALIDATE_TEMPLATE % {
+            "body": "".join("\n    " + line for line in lines)}
+        code = compile(src, "<bfh-schema %s>" % cls.__name__, "exec")
+        six.exec_(code, namespace)
+
+        validate = namespace["validate"]
+        validate.__doc__ = generic.__doc__
+        validate.compiled = True
+        cls.validate = validate
+
+    @classmethod
+    def _compile_serialize(cls):
+        """
+        Generate a `serialize` specialized to this schema's fields.
+
+        Does what the generic `serialize` does for each entry of
+        `_serialize_plan`, written out in order, so only fields with their
+        own `serialize` pay for calling it. A field that can't fill in a
+        default isn't asked for one.
+        """
+        if "serialize" in vars(cls):
+            # declared in the class body; leave hand-written ones alone
+            return
+        generic = Schema.__dict__["serialize"]
+        serialize = six.get_unbound_function(cls.serialize)
+        if serialize is not generic and not getattr(serialize, "compiled",
+                                                    False):
+            return
+
+        plain_get = six.get_unbound_function(fields.Field.__get__)
+        namespace = {
+            "is_serializable": _is_serializable,
+            "nullish": nullish,
+            "scalar_types": _SCALAR_TYPES,
+        }
+        lines = ["outd = {}", "d = self.__dict__"]
+        for i, (name, field_serialize) in enumerate(cls._serialize_plan):
+            field = cls._fields[name]
+            lines.append("value = d.get(%r)" % name)
+            field_get = getattr(type(field), "__get__", None)
+            if not (getattr(cls, name, None) is field
+                    and isinstance(field, fields.Field)
+                    and type(field).default is fields.Field.default
+                    and field_get is not None
+                    and six.get_unbound_function(field_get) is plain_get
+                    and field._default_value is None):
+                lines.extend([
+                    "if value is None:",
+                    "    value = getattr(self, %r)" % name,
+                ])
+            if field_serialize is not None:
+                namespace["_s%d" % i] = field_serialize
+                lines.append(
+                    "value = _s%d(value, implicit_nulls=implicit_nulls)" % i)
+            lines.extend([
+                "if type(value) in scalar_types:",
+                "    outd[%r] = value" % name,
+                "else:",
+                "    if is_serializable(value):",
+                "        value = value.serialize("
+                "implicit_nulls=implicit_nulls)",
+                "    if not implicit_nulls or not nullish(value):",
+                "        outd[%r] = value" % name,
+            ])
+
+        src = SERIALIZE_TEMPLATE % {
+            "body": "".join("\n    " + line for line in lines)}
+        code = compile(src, "<bfh-schema %s>" % cls.__name__, "exec")
+        six.exec_(code, namespace)
+
+        serialize = namespace["serialize"]
+        serialize.__doc__ = generic.__doc__
+        serialize.compiled = True
+        cls.serialize = serialize
+
+    @classmethod
+    def _compile_init(cls):
+        """
+        Generate an `__init__` specialized to this schema's fields.
+
+        Each field's keyword is looked up directly instead of walking the
+        kwargs through `_input_names`; anything left over (unknown names,
+        "__name" spellings) still goes through `_set_inputs`.
+        """
+        if "__init__" in vars(cls) or not cls._has_field_init():
+            # declared in the class body; leave hand-written inits alone
+            return
+
+        namespace = {
+            "_target": cls,
+            "_generic": Schema.__dict__["__init__"],
+            "_names": frozenset(cls._field_names),
+        }
+        lines = [
+            # reached via super() from a subclass with its own fields
+            "if type(self) is not _target:",
+            "    return _generic(self, *args, **kwargs)",
+            # a dict passed positionally: merge it into kwargs right here
+            # rather than unpacking it into another call
+            "if args and len(args) == 1 and isinstance(args[0], dict):",
+            "    kwargs = dict(args[0], **kwargs)",
+            "d = self.__dict__",
+            "d['_raw_input'] = kwargs",
+        ]
+        for i, (name, subschema_class) in enumerate(cls._subschema_fields):
+            namespace["_s%d" % i] = subschema_class
+            lines.append("d[%r] = _s%d()" % (name, i))
+
+        lines.append("found = 0")
+        for name in cls._field_names:
+            if name in cls._coerced_names:
+                assign = "setattr(self, %r, kwargs[%r])" % (name, name)
+            else:
+                assign = "d[%r] = kwargs[%r]" % (name, name)
+            lines.extend([
+                "if %r in kwargs:" % name,
+                "    " + assign,
+                "    found += 1",
+            ])
+        lines.extend([
+            "if found != len(kwargs):",
+            "    self._set_inputs([item for item in kwargs.items()",
+            "                      if item[0] not in _names])",
+        ])
+
+        src = INIT_TEMPLATE % {
+            "body": "".join("\n    " + line for line in lines)}
+        code = compile(src, "<bfh-schema %s>" % cls.__name__, "exec")
+        six.exec_(code, namespace)
+
+        init = namespace["__init__"]
+        init.__doc__ = Schema.__dict__["__init__"].__doc__
+        init.compiled = True
+        cls.__init__ = init
+
+    @classmethod
+    def _has_field_init(cls):
+        """
+        Is `__init__` the stock field-by-field one (generic or generated)?
+
+        """
+        init = six.get_unbound_function(cls.__init__)
+        return (init is Schema.__dict__["__init__"]
+                or getattr(init, "compiled", False))
+
+    @classmethod
+    def _compile_builder(cls, names):
+        """
+        Generate a function that takes one positional value per name in
+        `names` and builds an instance, exactly as if they had been passed to
+        `__init__` as keyword arguments.
+
+        Mappings know their output names up front, so this skips packing and
+        unpacking a kwargs dict for every record.
+        """
+        params = ["v%d" % i for i in range(len(names))]
+        namespace, lines = cls._builder_source(names, params)
+        src = BUILD_TEMPLATE % {
+            "params": ", ".join(params),
+            "body": "".join("\n    " + line for line in lines),
+        }
+        code = compile(src, "<bfh-schema %s>" % cls.__name__, "exec")
+        six.exec_(code, namespace)
+        return namespace["build"]
+
+    @classmethod
+    def _builder_source(cls, names, params):
+        """
+        The statements that build an instance into `instance` from the
+        variables named in `params`, along with the namespace they need.
+
+        Shared by `_compile_builder` and the generated `Mapping.apply`, which
+        inlines them.
+        """
+        namespace = {"_target": cls}
+        lines = [
+            "instance = _target.__new__(_target)",
+            "d = instance.__dict__",
+            "d['_raw_input'] = {%s}" % ", ".join(
+                "%r: %s" % pair for pair in zip(names, params)),
+        ]
+
+        for i, (name, subschema_class) in enumerate(cls._subschema_fields):
+            namespace["_s%d" % i] = subschema_class
+            lines.append("d[%r] = _s%d()" % (name, i))
+
+        for key, param in zip(names, params):
+            name = cls._input_names.get(key)
+            if name is None and key.startswith("__"):
+                name = cls._input_names.get(key.strip("_"))
+            if name is None:
+                continue
+            if name in cls._coerced_names:
+                lines.append("setattr(instance, %r, %s)" % (name, param))
+            else:
+                lines.append("d[%r] = %s" % (name, param))
+
+        return namespace, lines
+
+    __setattr__ = _dedunder_setattr
 
     def __getattr__(self, name):
         name = dedunder(name)
         return object.__getattribute__(self, name)
 
+    @classmethod
+    def from_values(cls, *values):
+        """
+        Build an instance from one positional value per field.
+
+        Values are taken in the order of `_field_names`. The result is the
+        same as passing them to the constructor by name, without packing
+        and walking a kwargs dict, which adds up when building lots of
+        small records::
+
+            Animal._field_names
+            # ('legs', 'name', 'noise', 'type')
+            Animal.from_values(4, "Fido", "woof!", "dog")
+
+        Args:
+            *values: a value for every field
+
+        Returns:
+            an instance of this schema
+        """
+        # built on first use, per class; read back through __dict__ so a
+        # subclass doesn't pick up its parent's
+        build = cls.__dict__.get("_values_builder")
+        if build is None:
+            build = _target_builder(cls, cls._field_names)
+            cls._values_builder = build
+        return build(*values)
+
     def serialize(self, implicit_nulls=False):
         """
         Represent this schema as a dictionary.
@@ -106,19 +607,24 @@ class Schema(SchemaInterface):
             dict
         """
         outd = {}
-        for name in self._field_names:
-            field = self._fields.get(name)
-            value = getattr(self, name)
-            if hasattr(field, "serialize"):
-                value = field.serialize(value, implicit_nulls=implicit_nulls)
+        d = self.__dict__
+        for name, field_serialize in self._serialize_plan:
+            value = d.get(name)
+            if value is None:
+                value = getattr(self, name)  # let the field fill in defaults
+
+            if field_serialize is not None:
+                value = field_serialize(value, implicit_nulls=implicit_nulls)
+
+            if type(value) in _SCALAR_TYPES:
+                # never a schema, never nullish: nothing more to decide
+                outd[name] = value
+                continue
 
-            if hasattr(value, "serialize"):
+            if _is_serializable(value):
                 value = value.serialize(implicit_nulls=implicit_nulls)
 
-            if implicit_nulls and nullish(value,
-                                          implicit_nulls=implicit_nulls):
-                pass
-            else:
+            if not implicit_nulls or not nullish(value):
                 outd[name] = value
 
         return outd
@@ -133,24 +639,59 @@ class Schema(SchemaInterface):
         Raises:
             Invalid
         """
-        return all([v.validate(getattr(self, k))
-                    for k, v in self._fields.items()])
+        d = self.__dict__
+        for name, field in self._field_items:
+            value = d.get(name)
+            if value is None:
+                value = getattr(self, name)  # let the field fill in defaults
+            if not field.validate(value):
+                return False
+        return True
 
     @property
     def is_empty(self):
+        d = self.__dict__
         for name in self._field_names:
-            if not nullish(getattr(self, name)):
+            value = d.get(name)
+            if value is None:
+                value = getattr(self, name)  # let the field fill in defaults
+                if value is None:
+                    continue
+            if not nullish(value):
                 return False
         return True
 
     @property
     def _raw(self):
-        out = dict(**self._raw_input)
+        out = dict(self._raw_input)
+        d = self.__dict__
         for name in self._field_names:
-            value = getattr(self, name)
+            value = d.get(name)
+            if value is None:
+                value = getattr(self, name)  # let the field fill in defaults
             out[name] = _get_raw_value(value)
 
-        return GenericSchema(**out)
+        return GenericSchema._from_dict(out)
+
+
+INIT_TEMPLATE = """
+def __init__(self, *args, **kwargs):%(body)s
+"""
+
+SERIALIZE_TEMPLATE = """
+def serialize(self, implicit_nulls=False):%(body)s
+    return outd
+"""
+
+VALIDATE_TEMPLATE = """
+def validate(self):%(body)s
+    return True
+"""
+
+BUILD_TEMPLATE = """
+def build(%(params)s):%(body)s
+    return instance
+"""
 
 
 class GenericSchema(SchemaInterface):
@@ -171,23 +712,19 @@ class GenericSchema(SchemaInterface):
 
     def _serialize_value(self, value, implicit_nulls=False):
         """
-        Serialize a value, recursively descending through the object to make
-        sure any nested objects are also serialized.
+        Serialize a value, descending through the object to make sure any
+        nested objects are also serialized.
 
         """
-        if hasattr(value, "serialize"):
-            value = value.serialize(implicit_nulls=implicit_nulls)
+        handler = _SERIALIZE_DISPATCH.get(type(value))
+        if handler is not None:
+            return handler(value, implicit_nulls=implicit_nulls)
 
-        if isinstance(value, (list, tuple)):
-            items = []
-            for i in value:
-                ser = self._serialize_value(
-                    i, implicit_nulls=implicit_nulls)
-
-                if not nullish(ser, implicit_nulls=implicit_nulls):
-                    items.append(ser)
+        if _is_serializable(value):
+            value = value.serialize(implicit_nulls=implicit_nulls)
 
-            value = items
+        if _is_sequence(value):
+            value = _serialize_sequence(value, implicit_nulls=implicit_nulls)
 
         if implicit_nulls and nullish(
                 value, implicit_nulls=implicit_nulls):
@@ -204,16 +741,30 @@ class GenericSchema(SchemaInterface):
         Returns:
             dict
         """
-        outd = {}
-        for name, value in self.__dict__.items():
-            value = self._serialize_value(value, implicit_nulls=implicit_nulls)
-            if implicit_nulls and nullish(
-                    value, implicit_nulls=implicit_nulls):
-                pass
+        serialize_value = self._serialize_value
+        result = {}
+        # nested plain GenericSchemas are walked with an explicit stack of
+        # (items left, output dict, parent output dict, key in parent)
+        stack = [(iter(self.__dict__.items()), result, None, None)]
+        while stack:
+            items, outd, parent, key = stack[-1]
+            for name, value in items:
+                if type(value) is GenericSchema:
+                    # finish the nested schema before carrying on with this one
+                    stack.append(
+                        (iter(value.__dict__.items()), {}, outd, name))
+                    break
+
+                value = serialize_value(value, implicit_nulls=implicit_nulls)
+                # _serialize_value already turned nullish values into None
+                if value is not None or not implicit_nulls:
+                    outd[name] = value
             else:
-                outd[name] = value
+                stack.pop()
+                if parent is not None and (outd or not implicit_nulls):
+                    parent[key] = outd
 
-        return outd
+        return result
 
     def validate(self):
         """
@@ -228,11 +779,236 @@ class GenericSchema(SchemaInterface):
 
     @property
     def _raw(self):
-        out = dict(**self.__dict__)
+        out = dict(self.__dict__)
         for key, val in out.items():
             out[key] = _get_raw_value(val)
 
-        return GenericSchema(**out)
+        return GenericSchema._from_dict(out)
+
+    @classmethod
+    def _from_dict(cls, values):
+        """
+        Wrap `values` in a GenericSchema without copying it.
+
+        Equivalent to ``GenericSchema(**values)`` for a plain GenericSchema,
+        minus the setattr for every key.
+        """
+        instance = cls.__new__(cls)
+        instance.__dict__ = values
+        return instance
+
+
+def _builds_directly(target_schema, names):
+    """
+    Can instances of `target_schema` be built without calling `__init__`?
+
+    """
+    return (isinstance(target_schema, type)
+            and issubclass(target_schema, Schema)
+            and target_schema._has_field_init()
+            and len(names) < 255)  # python 2 caps positional arguments
+
+
+def _target_builder(target_schema, names):
+    """
+    Make a function that builds a `target_schema` instance from positional
+    values given in the order of `names`.
+
+    """
+    if _builds_directly(target_schema, names):
+        return target_schema._compile_builder(names)
+
+    target = target_schema or GenericSchema
+
+    def build_target(*values):
+        return target(**dict(zip(names, values)))
+    return build_target
+
+
+def _source_loader(source_schema):
+    """
+    Make a function that coerces an input blob into `source_schema`.
+
+    Whether there is a source schema at all is fixed per mapping, so choose
+    the branch once rather than on every apply.
+    """
+    if source_schema is None:
+        return lambda blob: blob
+
+    def load_source(blob):
+        if isinstance(blob, source_schema):
+            return blob
+        return source_schema(**blob or {})
+    return load_source
+
+
+_NOT_CONSTANT = object()
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")
+
+
+def _constant_value(transform):
+    """
+    The value `transform` gives for every source, if that can be known up
+    front, else `_NOT_CONSTANT`.
+
+    That covers a `Const` of a literal value, a `Concat` of nothing
+    but literal strings, and a stock coercion, however nested, of a plain
+    literal like `Str(Bool(Num(1)))`.
+    """
+    kind = type(transform)
+    if kind is transformations.Const:
+        if transform.args and not is_transformation(transform.args[0]):
+            return transform.args[0]
+
+    elif kind is transformations.Concat:
+        if all(isinstance(arg, six.string_types) for arg in transform.args):
+            return transform(None)
+
+    elif (issubclass(kind, transformations.CoerceType)
+            and len(transform.args) == 1
+            and transformations._is_stock_coercion(kind)):
+        arg = transform.args[0]
+        if is_transformation(arg):
+            arg = _constant_value(arg)
+        if arg is None or type(arg) in _SCALAR_TYPES:
+            coerce = transformations._coercion(kind, transform.required)
+            try:
+                return coerce(arg)
+            except (TypeError, ValueError):
+                pass  # let it fail when applied, as it always has
+
+    return _NOT_CONSTANT
+
+
+def _inline_args(args, name, namespace, source_schema):
+    """
+    Python expressions for each of a transform's `args`, as passed to its
+    `function`: literals are bound into `namespace` and transformations
+    are inlined where possible, or else called on the source.
+    """
+    values = []
+    for i, arg in enumerate(args):
+        arg_name = "%s_%d" % (name, i)
+        if not is_transformation(arg):
+            namespace[arg_name] = arg
+            values.append(arg_name)
+            continue
+        value = _inline_transform(arg, arg_name, namespace, source_schema)
+        if value is None:
+            namespace[arg_name] = arg
+            value = "%s(source)" % arg_name
+        values.append(value)
+    return values
+
+
+def _inline_transform(transform, name, namespace, source_schema):
+    """
+    A Python expression with the same value as `transform(source)`, for
+    writing into a generated `apply`, or None if it has to be called.
+    `source_schema` is the schema class every source is an instance of, or
+    None if sources could be anything.
+
+    Only the plainest transforms qualify:
+
+    - constants (see `_constant_value`), bound into `namespace` as `name`
+    - `All`
+    - `Get`: a one-key, optional, default-less one becomes a lookup, and
+      any other calls its compiled path walk
+    - `Do`, which calls its function directly on its arguments
+    - a stock coercion like `Int`, and a `Many` of one
+    - `Chain` and `Concat`
+    - a one-argument `Submapping` or `ManySubmap`, which calls the inner
+      mapping's `apply` directly
+
+    Arguments are inlined in turn, where possible.
+    """
+    kind = type(transform)
+    constant = _constant_value(transform)
+    if constant is not _NOT_CONSTANT:
+        namespace[name] = constant
+        return name
+
+    elif kind is transformations.All:
+        if transform.strict:
+            return "source"
+        if source_schema is not None and hasattr(source_schema, "_raw"):
+            return "source._raw"
+        return "(source._raw if hasattr(source, '_raw') else source)"
+
+    elif kind is transformations.Get:
+        path = transform.path
+        if (len(path) == 1 and isinstance(path[0], six.string_types)
+                and not transform.required and transform.default is None):
+            key = path[0]
+            if source_schema is None:
+                return "(source.get(%r) if source_is_dict else " \
+                    "getattr(source, %r, None))" % (key, key)
+            field = source_schema._fields.get(key)
+            if (field is not None
+                    and getattr(source_schema, key, None) is field
+                    and _IDENTIFIER.match(key) and not iskeyword(key)):
+                # a declared field never raises, so no default is needed
+                return "source.%s" % key
+            return "getattr(source, %r, None)" % key
+        if transform._accessor is not None:
+            # anything longer goes straight to the compiled walk
+            namespace[name] = transform._accessor
+            namespace["%s_default" % name] = transform.default
+            return "%s(source, %s_default)" % (name, name)
+
+    elif kind is transformations.Do:
+        # call the function directly on its args
+        if transform.args and not is_transformation(transform.args[0]):
+            namespace[name] = transform.args[0]
+            args = _inline_args(transform.args[1:], name, namespace,
+                                source_schema)
+            return "%s(%s)" % (name, ", ".join(args))
+
+    elif (issubclass(kind, transformations.CoerceType)
+            and len(transform.args) == 1
+            and transformations._is_stock_coercion(kind)):
+        # e.g. Int(Get('x')) becomes int(source.x), or near enough
+        args = _inline_args(transform.args, name, namespace, source_schema)
+        namespace[name] = transformations._coercion(kind, transform.required)
+        return "%s(%s)" % (name, args[0])
+
+    elif (kind in (transformations.Submapping, transformations.ManySubmap)
+            and len(transform.args) == 1):
+        # straight to the (single, stateless) inner mapping's apply
+        arg = _inline_args(transform.args, name, namespace, source_schema)[0]
+        namespace[name] = transform._submapping.apply
+        if kind is transformations.Submapping:
+            return "%s(%s)" % (name, arg)
+        namespace["_many_items"] = transformations._many_items
+        return "[%s(item) for item in _many_items((%s,))]" % (name, arg)
+
+    elif kind is transformations.Many and transform._coerces_directly:
+        # the same comprehension Many.function runs, minus the calls
+        args = _inline_args(transform.args, name, namespace, source_schema)
+        subtrans = transform.subtrans
+        namespace[name] = subtrans.target_type
+        namespace["%s_nulls" % name] = subtrans.null_types
+        namespace["_many_items"] = transformations._many_items
+        items = "_many_items((%s))" % "".join(arg + ", " for arg in args)
+        if transform.kwargs.get("required"):
+            return "[%s(item) for item in %s]" % (name, items)
+        return "[item if item in %s_nulls else %s(item) for item in %s]" % (
+            name, name, items)
+
+    elif kind is transformations.Chain:
+        args = _inline_args(transform.args, name, namespace, source_schema)
+        namespace["_chain"] = chain.from_iterable
+        return "list(_chain((%s)))" % "".join(arg + ", " for arg in args)
+
+    elif kind is transformations.Concat and transform.args:
+        args = _inline_args(transform.args, name, namespace, source_schema)
+        if transform.strict:
+            return "''.join((%s,))" % ", ".join(args)
+        # a falsey piece is dropped, as in Concat.function
+        return "''.join(filter(None, (%s,)))" % ", ".join(args)
+
+    return None
 
 
 class Mapping(MappingInterface):
@@ -278,21 +1054,176 @@ class Mapping(MappingInterface):
         Returns:
             instance of `self.target_schema` (if declared) or GenericSchema
         """
-        if self.source_schema is None:
-            loaded_source = blob
-        elif isinstance(blob, self.source_schema):
+        source_schema = self.source_schema
+        if source_schema is None or isinstance(blob, source_schema):
             loaded_source = blob
         else:
-            loaded_source = self.source_schema(**blob or {})
+            loaded_source = source_schema(**blob or {})
 
-        all_attrs = self._fields.keys()
         target_dict = {}
-        for attr_name in all_attrs:
-            transform = self._fields[attr_name]
-            result = transform(loaded_source)
-            target_dict[attr_name] = result
+        for attr_name, transform in self._field_items:
+            target_dict[attr_name] = transform(loaded_source)
 
-        if self.target_schema is None:
+        target_schema = self.target_schema
+        if target_schema is None:
             return GenericSchema(**target_dict)
 
-        return self.target_schema(**target_dict)
+        return target_schema(**target_dict)
+
+    def apply_many(self, blobs):
+        """
+        Push a batch of blobs through the mapping.
+
+        Equivalent to ``[self.apply(blob) for blob in blobs]``: each blob is
+        transformed in turn, so errors and `Do` side effects happen in the
+        same order. `apply` is looked up once for the whole batch.
+
+        Args:
+            blobs (iterable of dict or Schema): the things to transform
+
+        Returns:
+            list of `self.target_schema` (if declared) or GenericSchema
+        """
+        apply = self.apply
+        return [apply(blob) for blob in blobs]
+
+    @classmethod
+    def _has_field_apply(cls):
+        """
+        Is `apply` the stock field-by-field one (generic or generated)?
+
+        """
+        apply = six.get_unbound_function(cls.apply)
+        return (apply is Mapping.__dict__["apply"]
+                or getattr(apply, "compiled", False))
+
+    @classmethod
+    def _declared(cls, name):
+        """
+        The value declared on the class for `name`, or None if it was left
+        to the interface's default.
+
+        """
+        value = getattr(cls, name, None)
+        if isinstance(value, property):
+            return None
+        return value
+
+    @classmethod
+    def _overrides_property(cls, name):
+        """
+        Is `name` a property other than the interface's default one?
+
+        Such a schema can change from call to call, so it has to be looked
+        up on the instance every time.
+        """
+        value = getattr(cls, name, None)
+        return (isinstance(value, property)
+                and value is not vars(MappingInterface)[name])
+
+    @classmethod
+    def _finalize_class(cls):
+        cls._load_source = staticmethod(
+            _source_loader(cls._declared("source_schema")))
+        cls._build_target = staticmethod(
+            _target_builder(cls._declared("target_schema"), cls._field_names))
+        cls._compile_apply()
+
+    @classmethod
+    def _compile_apply(cls):
+        """
+        Generate an `apply` specialized to this mapping's fields.
+
+        The field set of a mapping is fixed once the class is built, so
+        instead of looping over `_fields` on every call we write out each
+        transform call inline and `exec` the result once per class.
+        """
+        if "apply" in vars(cls):
+            # declared in the class body; leave hand-written applies alone
+            return
+
+        if not cls._has_field_apply():
+            return
+        generic = Mapping.__dict__["apply"]
+
+        transforms = [transform for _, transform in cls._field_items]
+        if (cls._overrides_property("source_schema")
+                or cls._overrides_property("target_schema")
+                or not all(callable(t) for t in transforms)
+                or len(transforms) >= 255):  # python 2 caps call arguments
+            cls.apply = generic
+            return
+
+        namespace = {
+            "load_source": cls._load_source,
+            "build_target": cls._build_target,
+            "generic": generic,
+            "declared_source": cls._declared("source_schema"),
+            "declared_target": cls._declared("target_schema"),
+        }
+        # a loaded source is always a schema instance if one is declared;
+        # otherwise inlined lookups need to know if they're facing a dict
+        source_schema = cls._declared("source_schema")
+        if not (isinstance(source_schema, type)
+                and issubclass(source_schema, SchemaInterface)
+                and not issubclass(source_schema, dict)):
+            source_schema = None
+        values = []
+        for i, transform in enumerate(transforms):
+            name = "_t%d" % i
+            value = _inline_transform(transform, name, namespace,
+                                      source_schema)
+            if value is None:
+                namespace[name] = transform
+                value = "%s(source)" % name
+            values.append(value)
+
+        prelude = []
+        if any("source_is_dict" in value for value in values):
+            prelude.append("source_is_dict = isinstance(source, dict)")
+
+        target_schema = cls._declared("target_schema")
+        if _builds_directly(target_schema, cls._field_names):
+            # build the target inline too, saving a call per record
+            params = ["v%d" % i for i in range(len(values))]
+            target_namespace, lines = target_schema._builder_source(
+                cls._field_names, params)
+            namespace.update(target_namespace)
+            lines[:0] = prelude + [
+                "%s = %s" % pair for pair in zip(params, values)]
+            src = INLINE_APPLY_TEMPLATE % {
+                "guard": APPLY_GUARD,
+                "body": "".join("\n    " + line for line in lines)}
+        else:
+            src = APPLY_TEMPLATE % {
+                "guard": APPLY_GUARD,
+                "prelude": "".join("\n    " + line for line in prelude),
+                "values": ", ".join(values),
+            }
+        code = compile(src, "<bfh-mapping %s>" % cls.__name__, "exec")
+        six.exec_(code, namespace)
+
+        apply = namespace["apply"]
+        apply.__doc__ = generic.__doc__
+        apply.compiled = True
+        cls.apply = apply
+
+
+# the schemas are baked in; if either has been reassigned since, on the class
+# or the instance, go the long way
+APPLY_GUARD = """
+    if (self.source_schema is not declared_source
+            or self.target_schema is not declared_target):
+        return generic(self, blob)"""
+
+APPLY_TEMPLATE = """
+def apply(self, blob):%(guard)s
+    source = load_source(blob)%(prelude)s
+    return build_target(%(values)s)
+"""
+
+INLINE_APPLY_TEMPLATE = """
+def apply(self, blob):%(guard)s
+    source = load_source(blob)%(body)s
+    return instance
+"""
@@ -4,18 +4,19 @@ Utility functions for BFH
 """
 from __future__ import absolute_import
 
-import re
 from datetime import timedelta, tzinfo
 
 __all__ = [
     "NULLISH",
     "dedunder",
+    "is_iso_datetime",
     "nullish",
     "utc",
 ]
 
 
-DUNDER_MATCH = re.compile(r'_.+?__')  # python's privacy prefix "_Foo__"
+_DEDUNDER_CACHE = {}
+_DEDUNDER_CACHE_SIZE = 4096
 
 
 def dedunder(name):
@@ -32,27 +33,78 @@ def dedunder(name):
     Returns:
         the name stripped of the privacy prefix, if it had one.
     """
-    if DUNDER_MATCH.match(name):
-        return DUNDER_MATCH.sub('', name)
-    return name
+    result = _DEDUNDER_CACHE.get(name)
+    if result is not None:
+        return result
+
+    result = name
+    # python's privacy prefix "_Foo__"
+    if len(name) > 3 and name[0] == '_' and name[1] != '_':
+        i = name.find('__', 2)
+        if i != -1:
+            result = name[i + 2:]
+
+    if len(_DEDUNDER_CACHE) < _DEDUNDER_CACHE_SIZE:
+        _DEDUNDER_CACHE[name] = result
+    return result
+
+
+_ISO_MATCH_CACHE = {}
+_ISO_MATCH_CACHE_SIZE = 4096
+
+
+def is_iso_datetime(value):
+    """
+    Does `value` start with an ISO 8601 datetime, "YYYY-MM-DDTHH:MM:SS"?
+
+    The layout is fixed, so rather than run a regex just look at the
+    separators and digit runs where they must be. Results are memoized,
+    since the same date strings tend to turn up over and over in a batch.
+    """
+    result = _ISO_MATCH_CACHE.get(value)
+    if result is None:
+        result = (
+            len(value) >= 19 and
+            value[4] == '-' and value[7] == '-' and value[10] == 'T' and
+            value[13] == ':' and value[16] == ':' and
+            # only ASCII digits; str.isdigit also takes things like u"\xb2"
+            not (value[0:4] + value[5:7] + value[8:10] + value[11:13] +
+                 value[14:16] + value[17:19]).lstrip("0123456789")
+        )
+        if len(_ISO_MATCH_CACHE) < _ISO_MATCH_CACHE_SIZE:
+            _ISO_MATCH_CACHE[value] = result
+    return result
 
 
 # Types that are falsey, but not False itself.
 NULLISH = (None, {}, [], tuple())
 
+_EMPTY_CONTAINER_TYPES = frozenset([dict, list, tuple])
+
 
 def nullish(value, implicit_nulls=True):
     """
     Kwargs:
         implicit_nulls (bool): accept empty containers as well as None
     """
-    if implicit_nulls:
-        if hasattr(value, 'is_empty'):
-            return value.is_empty
+    if value is None:
+        return True
+    if not implicit_nulls:
+        return False
+
+    value_type = type(value)
+    if value_type in _EMPTY_CONTAINER_TYPES:
+        return not value
 
-        return value in NULLISH
+    if getattr(value_type, 'is_empty', None) is not None:
+        return value.is_empty
 
-    return value is None
+    if isinstance(value, (dict, list, tuple)):  # subclasses of the above
+        return not value
+    return False
+
+
+_ZERO = timedelta(0)
 
 
 class UTC(tzinfo):
@@ -60,16 +112,24 @@ class UTC(tzinfo):
     UTC tzinfo.
 
     Why isn't this in the standard library?
+    (It is, as of Python 3.2: where available `utc` is `datetime.timezone.utc`,
+    which is implemented in C.)
     """
-    OFFSET = timedelta(0)
+    __slots__ = ()
+
+    OFFSET = _ZERO
 
     def utcoffset(self, dt):
-        return self.OFFSET
+        return _ZERO
 
     def tzname(self, dt):
         return "UTC"
 
     def dst(self, dt):
-        return self.OFFSET
+        return _ZERO
 
-utc = UTC()
+try:
+    from datetime import timezone
+    utc = timezone.utc
+except ImportError:  # python 2
+    utc = UTC()
@@ -9,14 +9,13 @@ from __future__ import absolute_import
 import re
 from datetime import datetime
 
-from .common import nullish
+import six
+
+from .common import is_iso_datetime, nullish
 from .exceptions import Invalid
-from .interfaces import FieldInterface, SchemaInterface
+from .interfaces import FieldInterface, SchemaInterface, is_field
 
-try:
-    string_type = unicode
-except NameError:
-    string_type = str
+string_type = six.text_type
 
 
 __all__ = [
@@ -33,6 +32,21 @@ __all__ = [
 ]
 
 
+# below this many items, a plain loop checks types faster than a set(map())
+_TYPE_SCAN_MIN_LENGTH = 256
+
+
+def _all_nullish(values):
+    """
+    Is every value in the dict nullish? Stops at the first one that isn't.
+
+    """
+    for value in values.values():
+        if value is not None and not nullish(value):
+            return False
+    return True
+
+
 class Field(FieldInterface):
     """
     Base class for a field.
@@ -48,6 +62,9 @@ class Field(FieldInterface):
                 return False
 
     """
+    __slots__ = ('required', 'field_name', '_default_value',
+                 '_default_callable')
+
     def __init__(self, required=True, default=None):
         """
         Initialize the field.
@@ -57,18 +74,26 @@ class Field(FieldInterface):
         """
         self.required = required
         self.default = default
+        self.field_name = "unnamed"
 
     def __get__(self, instance, cls=None):
         if instance is None:
             return self
 
-        value = instance.__dict__.get(self.field_name)
+        d = instance.__dict__
+        name = self.field_name
+        value = d.get(name)
         if value is not None:
             return value
+
+        if type(self).default is not Field.default:
+            default = self.default  # a subclass has its own idea of this
+        elif self._default_callable:
+            default = self._default_value()
         else:
-            default = self.default
-            instance.__dict__[self.field_name] = default
-            return default
+            default = self._default_value
+        d[name] = default
+        return default
 
     def __set__(self, instance, value):
         instance.__dict__[self.field_name] = value
@@ -90,21 +115,17 @@ class Field(FieldInterface):
             raise Invalid("%s: a value is required" % self.field_name)
         return True
 
-    @property
-    def field_name(self):
-        return getattr(self, "_field_name", "unnamed")
-
-    @field_name.setter
-    def field_name(self, value):
-        self._field_name = value
-
     @property
     def default(self):
-        return self._default() if callable(self._default) else self._default
+        if self._default_callable:
+            return self._default_value()
+        return self._default_value
 
     @default.setter
     def default(self, value):
-        self._default = value
+        # decide once whether this is a factory, not on every read
+        self._default_value = value
+        self._default_callable = callable(value)
 
 
 class Subschema(Field):
@@ -121,6 +142,8 @@ class Subschema(Field):
             # more fields
 
     """
+    __slots__ = ('subschema_class',)
+
     def __init__(self, subschema_class, *args, **kwargs):
         super(Subschema, self).__init__(*args, **kwargs)
         self.subschema_class = subschema_class
@@ -144,8 +167,8 @@ class Subschema(Field):
         if value is None:
             value = {}
 
-        if isinstance(value, dict) and implicit_nulls:
-            if all(nullish(v) for v in value.values()):
+        if implicit_nulls and value and isinstance(value, dict):
+            if _all_nullish(value):
                 value = {}
 
         return value
@@ -153,9 +176,10 @@ class Subschema(Field):
     def validate(self, value):
         super(Subschema, self).validate(value)
         if not self.required:
-            if nullish(value):
+            if nullish(value):  # asks a schema's is_empty, if it has one
                 return True
-            if getattr(value, "is_empty", False):
+            if (getattr(type(value), "is_empty", None) is None
+                    and getattr(value, "is_empty", False)):
                 return True
 
         if not hasattr(value, 'validate'):
@@ -171,14 +195,15 @@ class SimpleTypeField(Field):
 
     Expects a class attribute 'field_type'.
     """
-    def _valid(self, value):
-        if value is None and not self.required:
-            return True
-        return isinstance(value, self.field_type)
+    __slots__ = ()
 
     def validate(self, value):
-        super(SimpleTypeField, self).validate(value)
-        if not self._valid(value):
+        # Field.validate's required check, folded in to save a call
+        if value is None:
+            if self.required:
+                raise Invalid("%s: a value is required" % self.field_name)
+            return True
+        if not isinstance(value, self.field_type):
             raise Invalid("%s: %s is not a valid %s" % (self.field_name,
                                                         value,
                                                         self.field_type))
@@ -190,6 +215,8 @@ class BooleanField(SimpleTypeField):
     A field that should contain a boolean.
 
     """
+    __slots__ = ()
+
     field_type = bool
 
 
@@ -198,6 +225,8 @@ class IntegerField(SimpleTypeField):
     A field that should contain an integer.
 
     """
+    __slots__ = ()
+
     field_type = int
 
 
@@ -206,6 +235,8 @@ class NumberField(SimpleTypeField):
     A field that should contain a floating-point number.
 
     """
+    __slots__ = ()
+
     field_type = float
 
 
@@ -214,6 +245,8 @@ class DatetimeField(SimpleTypeField):
     A field that should contain a Python datetime object.
 
     """
+    __slots__ = ()
+
     field_type = datetime
 
 
@@ -224,6 +257,8 @@ class UnicodeField(SimpleTypeField):
     Expect unicode. If it's not already unicode, assume it's utf-8 and
     transform it to unicode.
     """
+    __slots__ = ('strict', 'encoding')
+
     field_type = string_type
 
     def __init__(self, strict=False, encoding='utf-8', **kwargs):
@@ -237,7 +272,7 @@ class UnicodeField(SimpleTypeField):
         self.encoding = encoding
 
     def _coerce(self, value):
-        if isinstance(value, string_type):
+        if type(value) is string_type or isinstance(value, string_type):
             return value
         try:
             return value.decode(self.encoding)
@@ -245,15 +280,21 @@ class UnicodeField(SimpleTypeField):
             raise Invalid("%s: %s is not a string" % (self.field_name, value))
 
     def validate(self, value):
+        if isinstance(value, self.field_type):
+            return True  # already a string: nothing to coerce or check
         if self.strict or (value is None and not self.required):
             return super(UnicodeField, self).validate(value)
         return super(UnicodeField, self).validate(self._coerce(value))
 
     def serialize(self, value, **kwargs):
-        try:
-            return self._coerce(value)
-        except Invalid:  # we are not in the business of validation here
+        # we are not in the business of validation here, so anything that
+        # can't decode passes through as is, without building an Invalid
+        if type(value) is string_type or isinstance(value, string_type):
             return value
+        decode = getattr(value, 'decode', None)
+        if decode is None:
+            return value
+        return decode(self.encoding)
 
 
 class IsoDateString(UnicodeField):
@@ -261,6 +302,8 @@ class IsoDateString(UnicodeField):
     A string field that validates that it contains an ISO 8601 date string
 
     """
+    __slots__ = ()
+
     ISO_REGEX = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
 
     def validate(self, value):
@@ -268,7 +311,7 @@ class IsoDateString(UnicodeField):
             return True
 
         super(IsoDateString, self).validate(value)
-        if not bool(self.ISO_REGEX.match(value)):
+        if not is_iso_datetime(value):
             raise Invalid("%s not an ISO 8601 date string")
 
         return True
@@ -279,6 +322,8 @@ class ObjectField(SimpleTypeField):
     A field that can contain a schemaless dict or object.
 
     """
+    __slots__ = ()
+
     field_type = (dict, SchemaInterface)
 
     def validate(self, value):
@@ -298,8 +343,8 @@ class ObjectField(SimpleTypeField):
         if value is None:
             value = {}
 
-        if isinstance(value, dict) and implicit_nulls:
-            if all(nullish(v) for v in value.values()):
+        if implicit_nulls and value and isinstance(value, dict):
+            if _all_nullish(value):
                 value = {}
 
         return value
@@ -321,6 +366,8 @@ class ArrayField(SimpleTypeField):
         {"ints": [1, 2, 3], "inners": [{"wow": 4}, {"wow": 5}]}
 
     """
+    __slots__ = ('_array_type', '_is_schema_type', '_is_field_type')
+
     field_type = (list, tuple)
 
     def __init__(self, array_type=None, **kwargs):
@@ -331,26 +378,34 @@ class ArrayField(SimpleTypeField):
         super(ArrayField, self).__init__(**kwargs)
         self.array_type = array_type
 
+    @property
+    def array_type(self):
+        return self._array_type
+
+    @array_type.setter
+    def array_type(self, array_type):
+        self._array_type = array_type
+        # decided once, since issubclass against an ABC isn't cheap. note
+        # array_type may be a field instance, as in ArrayField(IntegerField())
+        self._is_schema_type = (isinstance(array_type, type) and
+                                issubclass(array_type, SchemaInterface))
+        self._is_field_type = is_field(array_type)
+
     def __set__(self, instance, value):
         # don't coerce or validate simple Python types here; under the current
         # regime those happen elsewhere. just set the value.
-        if (self.array_type is None
-                or not issubclass(self.array_type, SchemaInterface)
+        if (not self._is_schema_type
                 or not isinstance(value, self.field_type)):
             instance.__dict__[self.field_name] = value
             return
 
         # when we have a schema array type, assume any dict
-        # passed is trying to fit the schema.
-        result = []
-        for i in value:
-            if isinstance(i, dict):
-                result.append(self.array_type(**i))
-            else:
-                # could already be a Schema instance, or maybe it's not even
-                # valid, but we don't care, we're not validating here
-                result.append(i)
-        instance.__dict__[self.field_name] = result
+        # passed is trying to fit the schema. anything else could already be
+        # a Schema instance, or maybe it's not even valid, but we don't care,
+        # we're not validating here
+        array_type = self._array_type
+        instance.__dict__[self.field_name] = [
+            array_type(**i) if isinstance(i, dict) else i for i in value]
 
     def _flatten(self, value, implicit_nulls=True):
         if hasattr(value, 'serialize'):
@@ -359,7 +414,7 @@ class ArrayField(SimpleTypeField):
 
     @property
     def is_schema_type(self):
-        return issubclass(self.array_type, SchemaInterface)
+        return self._is_schema_type
 
     def validate(self, items):
         # blech... it's not a validation lib. it's not a validation lib.
@@ -378,19 +433,37 @@ class ArrayField(SimpleTypeField):
                 in_schema = self.array_type(val)
                 return in_schema.validate()
 
-        elif self.array_type is not None and items is not None:
+        elif self._is_field_type and items is not None:
+            validate = self._array_type.validate
             for val in items:
-                if not isinstance(val, self.array_type):
-                    raise Invalid("%s is not a %s" % (val, self.array_type))
+                if not validate(val):
+                    raise Invalid("%s is not a valid %s" % (
+                        val, type(self._array_type).__name__))
+
+        elif self._array_type is not None and items is not None:
+            array_type = self._array_type
+            if (len(items) > _TYPE_SCAN_MIN_LENGTH
+                    and set(map(type, items)) == {array_type}):
+                return True  # homogeneous, so no need to go item by item
+            for val in items:
+                if type(val) is not array_type and \
+                        not isinstance(val, array_type):
+                    raise Invalid("%s is not a %s" % (val, array_type))
 
         return True
 
     def serialize(self, value, implicit_nulls=True):
         if isinstance(value, self.field_type):
-            items = []
-            for i in value:
-                flat = self._flatten(i, implicit_nulls=implicit_nulls)
-                if not nullish(flat, implicit_nulls=implicit_nulls):
-                    items.append(flat)
-            return items
+            if (six.get_unbound_function(type(self)._flatten)
+                    is not six.get_unbound_function(ArrayField._flatten)):
+                flatten = self._flatten
+                flats = [flatten(i, implicit_nulls=implicit_nulls)
+                         for i in value]
+            else:
+                # _flatten, inlined: one call per element adds up on long
+                # arrays
+                flats = [i.serialize(implicit_nulls=implicit_nulls)
+                         if hasattr(i, 'serialize') else i for i in value]
+            return [flat for flat in flats
+                    if flat is not None and not nullish(flat, implicit_nulls)]
         return value
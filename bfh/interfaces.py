@@ -6,6 +6,12 @@ from __future__ import absolute_import
 
 from abc import ABCMeta, abstractmethod, abstractproperty
 from six import add_metaclass
+from six.moves import intern
+
+try:
+    from types import MappingProxyType
+except ImportError:  # python 2
+    MappingProxyType = dict
 
 from .common import dedunder
 
@@ -14,6 +20,9 @@ __all__ = [
     "MappingInterface",
     "SchemaInterface",
     "TransformationInterface",
+    "is_field",
+    "is_schema",
+    "is_transformation",
 ]
 
 
@@ -23,6 +32,8 @@ class FieldInterface(object):
     Descriptor that defines a field on a Schema class.
 
     """
+    __slots__ = ()
+
     @abstractmethod
     def validate(self):
         """
@@ -44,6 +55,8 @@ class TransformationInterface(object):
     Descriptor that defines a field transformation on a Mapping class.
 
     """
+    __slots__ = ()
+
     @abstractmethod
     def function(self, whole_obj, *call_args, **kwargs):
         """
@@ -52,6 +65,51 @@ class TransformationInterface(object):
         """
 
 
+_SCHEMA_TYPES = {}
+_FIELD_TYPES = {}
+_TRANSFORMATION_TYPES = {}
+
+
+def is_schema(value):
+    """
+    Is `value` a SchemaInterface instance?
+
+    Same answer as `isinstance(value, SchemaInterface)`, but the answer is
+    cached per exact type, which skips the ABC machinery on hot paths.
+    """
+    value_type = type(value)
+    result = _SCHEMA_TYPES.get(value_type)
+    if result is None:
+        result = _SCHEMA_TYPES[value_type] = isinstance(value,
+                                                        SchemaInterface)
+    return result
+
+
+def is_field(value):
+    """
+    Is `value` a FieldInterface instance? Cached like `is_schema`.
+
+    """
+    value_type = type(value)
+    result = _FIELD_TYPES.get(value_type)
+    if result is None:
+        result = _FIELD_TYPES[value_type] = isinstance(value, FieldInterface)
+    return result
+
+
+def is_transformation(value):
+    """
+    Is `value` a TransformationInterface instance? Cached like `is_schema`.
+
+    """
+    value_type = type(value)
+    result = _TRANSFORMATION_TYPES.get(value_type)
+    if result is None:
+        result = _TRANSFORMATION_TYPES[value_type] = isinstance(
+            value, TransformationInterface)
+    return result
+
+
 class HasFieldsMeta(ABCMeta):
     """
     Metaclass for classes that may have fields.
@@ -61,17 +119,37 @@ class HasFieldsMeta(ABCMeta):
         new_class = super(HasFieldsMeta, metaclass).__new__(
             metaclass, classname, bases, attributes, *args, **kwargs
         )
-        setattr(new_class, '_fields', {})
-        setattr(new_class, '_field_names', [])
-        for name in dir(new_class):
-            attribute = getattr(new_class, name)
-            if not isinstance(attribute,
-                              (FieldInterface, TransformationInterface)):
+        # what each name resolves to on the new class: the first hit along
+        # the MRO, so a subclass can shadow an inherited field
+        resolved = {}
+        for klass in new_class.__mro__:
+            for name, attribute in vars(klass).items():
+                if name not in resolved:
+                    resolved[name] = attribute
+
+        found = {}
+        names = []
+        for name in sorted(resolved):
+            attribute = resolved[name]
+            if not (is_field(attribute) or is_transformation(attribute)):
                 continue
-            name = dedunder(name)
-            new_class._fields[name] = attribute
-            new_class._field_names.append(name)
+            name = intern(dedunder(name))
+            if name not in found:
+                names.append(name)
+            found[name] = attribute
             attribute.field_name = name
+
+        # frozen once built: everything downstream precomputes from these
+        new_class._field_names = tuple(names)
+        new_class._fields = MappingProxyType(found)
+        new_class._field_items = tuple(
+            (name, found[name]) for name in new_class._field_names)
+
+        # give the class a chance to precompute anything that depends on
+        # its finished field set
+        finalize = getattr(new_class, '_finalize_class', None)
+        if finalize is not None:
+            finalize()
         return new_class
 
 
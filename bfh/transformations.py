@@ -28,17 +28,19 @@ from datetime import datetime
 
 from dateutil.parser import parse as parse_date
 import six
+from six.moves import intern
 
 from itertools import chain
 
-from .common import utc
+from .common import is_iso_datetime, utc
 from .exceptions import Missing
-from .interfaces import TransformationInterface
+from .interfaces import TransformationInterface, is_transformation
 
-try:
-    unicode_type = unicode
-except NameError:
-    unicode_type = str
+unicode_type = six.text_type
+string_types = six.string_types
+
+# C-speed parsing for plain ISO 8601 input, where we have it (python 3.7+)
+_fromisoformat = getattr(datetime, 'fromisoformat', None)
 
 __all__ = [
     "All",
@@ -68,6 +70,8 @@ class All(TransformationInterface):
         If strict == False and called on a Schema instance, a GenericSchema
         Otherwise just the object.
     """
+    __slots__ = ('strict', 'field_name')
+
     def __init__(self, strict=False):
         self.strict = strict
 
@@ -80,6 +84,59 @@ class All(TransformationInterface):
         return source
 
 
+# generated path walks, shared by every Get with the same shape of path
+_ACCESSOR_CACHE = {}
+_ACCESSOR_CACHE_SIZE = 4096
+
+ACCESSOR_TEMPLATE = """
+def get(got, default):
+    try:%(body)s
+    except (KeyError, AttributeError) as e:
+        raise Missing(e)
+    return got
+"""
+
+REQUIRED_STEP = ("got = got[%(part)r] if type(got) is dict or "
+                 "isinstance(got, dict) else getattr(got, %(part)r)")
+
+LENIENT_STEP = ("got = got.get(%(part)r) if type(got) is dict or "
+                "isinstance(got, dict) else getattr(got, %(part)r, None)")
+
+
+def _path_accessor(path, required, defaulted):
+    """
+    A function `get(source, default)` that walks `path` into `source` the
+    way `Get.function` does, with the loop unrolled and the required and
+    default branches decided up front. None if `path` isn't all strings.
+
+    """
+    if not all(isinstance(part, string_types) for part in path):
+        return None
+
+    key = (path, required, defaulted)
+    accessor = _ACCESSOR_CACHE.get(key)
+    if accessor is not None:
+        return accessor
+
+    lines = []
+    for part in path:
+        if required:
+            lines.append(REQUIRED_STEP % {"part": part})
+        else:
+            lines.append(LENIENT_STEP % {"part": part})
+            if defaulted:
+                lines.append("if got is None: got = default")
+    src = ACCESSOR_TEMPLATE % {
+        "body": "".join("\n        " + line for line in lines or ["pass"])}
+    namespace = {"Missing": Missing}
+    six.exec_(compile(src, "<bfh-get %r>" % (path,), "exec"), namespace)
+    accessor = namespace["get"]
+
+    if len(_ACCESSOR_CACHE) < _ACCESSOR_CACHE_SIZE:
+        _ACCESSOR_CACHE[key] = accessor
+    return accessor
+
+
 class Get(TransformationInterface):
     """
     Gets a value from a dict or object
@@ -105,49 +162,99 @@ class Get(TransformationInterface):
         Missing if `required` is false
 
     """
+    __slots__ = ('_path', 'kwargs', '_required', '_default', 'field_name',
+                 '_dict_key', '_accessor')
+
     def __init__(self, *args, **kwargs):
         """
         """
-        self.path = args
+        # interned, so lookups against interned keys (like schema field
+        # names) can match on identity
+        self._path = tuple(
+            intern(part) if type(part) is str else part for part in args)
         self.kwargs = kwargs
-        self.required = kwargs.get('required', False)
-        self.default = kwargs.get('default')
+        self._required = kwargs.get('required', False)
+        self._default = kwargs.get('default')
+        self._refresh()
+
+    @property
+    def path(self):
+        return self._path
+
+    @path.setter
+    def path(self, path):
+        self._path = path
+        self._refresh()
+
+    @property
+    def required(self):
+        return self._required
+
+    @required.setter
+    def required(self, required):
+        self._required = required
+        self._refresh()
+
+    @property
+    def default(self):
+        return self._default
+
+    @default.setter
+    def default(self, default):
+        self._default = default
+        self._refresh()
+
+    def _refresh(self):
+        # work out the fast paths for the current path/required/default,
+        # not on every call
+        path = self._path
+        if (six.get_unbound_function(type(self).function)
+                is not six.get_unbound_function(Get.function)):
+            # a subclass walks the path its own way
+            self._dict_key = self._accessor = None
+            return
+        self._dict_key = (path[0] if len(path) == 1 and not self._required
+                          else None)
+        self._accessor = _path_accessor(tuple(path), bool(self._required),
+                                        self._default is not None)
 
     def __call__(self, source):
+        key = self._dict_key
+        if key is not None and type(source) is dict:
+            got = source.get(key)
+            if got is None:
+                return self.default
+            return got
+        accessor = self._accessor
+        if accessor is not None:
+            return accessor(source, self.default)
         return self.function(source)
 
-    def _get_from_dict(self, source, path):
-        if not self.required:
-            val = source.get(path)
-            if self.default is not None and val is None:
-                val = self.default
-            return val
-        return source[path]
-
-    def _get_from_obj(self, source, path):
-        if not self.required:
-            val = getattr(source, path, None)
-            if self.default is not None and val is None:
-                val = self.default
-            return val
-        return getattr(source, path)
-
-    def _get(self, source, path):
+    def function(self, source, path=None):
+        # the required/default branches are taken once per call instead of
+        # once per path segment
+        got = source
         try:
-            if isinstance(source, dict):
-                return self._get_from_dict(source, path)
-            return self._get_from_obj(source, path)
+            if self.required:
+                for part in path or self.path:
+                    if type(got) is dict or isinstance(got, dict):
+                        got = got[part]
+                    else:
+                        got = getattr(got, part)
+                return got
+
+            default = self.default
+            for part in path or self.path:
+                if type(got) is dict or isinstance(got, dict):
+                    got = got.get(part)
+                else:
+                    got = getattr(got, part, None)
+                if got is None and default is not None:
+                    got = default
+            return got
         except (KeyError, AttributeError) as e:
             raise Missing(e)
 
-    def function(self, source, path=None):
-        parts = path or self.path
-        first, rest = parts[0], parts[1:]
-        got = self._get(source, first)
-        if rest:
-            return self.function(got, rest)
-        return got
-
 
 class Transformation(TransformationInterface):
     """
@@ -159,6 +266,9 @@ class Transformation(TransformationInterface):
     Args:
         required (bool, default False): error if names missing
     """
+    __slots__ = ('_args', '_arg_specs', '_constant_args', 'kwargs',
+                 'required', 'field_name')
+
     def __init__(self, *args, **kwargs):
         self.args = args
         self.kwargs = kwargs
@@ -167,15 +277,26 @@ class Transformation(TransformationInterface):
         else:
             self.required = kwargs.get('required')
 
+    @property
+    def args(self):
+        return self._args
+
+    @args.setter
+    def args(self, args):
+        # sort out which args are transformations now, not on every call
+        self._args = args
+        self._arg_specs = tuple(
+            (is_transformation(arg), arg) for arg in args)
+        self._constant_args = not any(
+            is_transform for is_transform, _ in self._arg_specs)
+
     def __call__(self, source=None):
-        call_args = []
-        for arg in self.args:
-            if isinstance(arg, TransformationInterface):
-                call_args.append(arg(source))
-            else:
-                call_args.append(arg)
+        if self._constant_args:
+            return self.function(source, *self._args)
 
-        return self.function(source, *call_args)
+        return self.function(source, *[arg(source) if is_transform else arg
+                                        for is_transform, arg
+                                        in self._arg_specs])
 
 
 class Submapping(Transformation):
@@ -188,12 +309,16 @@ class Submapping(Transformation):
     Returns:
         result of applying submapping to the input
     """
+    __slots__ = ('submapping_class', '_submapping')
+
     def __init__(self, submapping_class, *args):
         self.submapping_class = submapping_class
         self.args = args
+        # mappings carry no state, so one instance serves every call
+        self._submapping = submapping_class()
 
     def function(self, source, *call_args):  # source ignored
-        return self.submapping_class().apply(call_args[0])
+        return self._submapping.apply(call_args[0])
 
 
 def _many_items(call_args, drop_nones=True):
@@ -201,6 +326,15 @@ def _many_items(call_args, drop_nones=True):
     Helper function for array-ish transformations.
 
     """
+    if len(call_args) == 1:
+        # the usual case, a single Get: no need to filter into a new list
+        item = call_args[0]
+        if item is None and drop_nones:
+            return []
+        if isinstance(item, (list, tuple)):
+            return item
+        return [item]
+
     if drop_nones:
         call_args = [i for i in call_args if i is not None]
 
@@ -224,9 +358,11 @@ class ManySubmap(Submapping):
     Returns:
         results of applying submapping to each item in the input
     """
+    __slots__ = ()
+
     def function(self, source, *call_args):  # source ignored
-        return [self.submapping_class().apply(item)
-                for item in _many_items(call_args)]
+        apply = self._submapping.apply
+        return [apply(item) for item in _many_items(call_args)]
 
 
 class Many(Transformation):
@@ -240,17 +376,41 @@ class Many(Transformation):
     Returns:
         results of applying subtransformation to each item in the input
     """
+    __slots__ = ('_subtrans', '_coerces_directly')
+
     def __init__(self, subtrans, *args, **kwargs):
         self.subtrans = subtrans  # Transformation
         self.args = args
         self.kwargs = kwargs
 
+    @property
+    def subtrans(self):
+        return self._subtrans
+
+    @subtrans.setter
+    def subtrans(self, subtrans):
+        self._subtrans = subtrans
+        # is subtrans a stock type coercion we can apply without building a
+        # transformation per item? decided here, not on every call
+        self._coerces_directly = (isinstance(subtrans, type) and
+                                  _is_stock_coercion(subtrans))
+
     def function(self, source, *call_args):
-        if isinstance(self.subtrans, Submapping):
+        subtrans = self._subtrans
+        if isinstance(subtrans, Submapping):
             raise ValueError("Can't Many(Submapping). Use Manymap instead.")
 
-        return [self.subtrans(item, **self.kwargs)()
-                for item in _many_items(call_args)]
+        items = _many_items(call_args)
+        if self._coerces_directly:
+            target_type = subtrans.target_type
+            if self.kwargs.get('required'):
+                return [target_type(item) for item in items]
+            null_types = subtrans.null_types
+            return [item if item in null_types else target_type(item)
+                    for item in items]
+
+        kwargs = self.kwargs
+        return [subtrans(item, **kwargs)() for item in items]
 
 
 class Const(Transformation):
@@ -258,6 +418,8 @@ class Const(Transformation):
     Return a constant value.
 
     """
+    __slots__ = ()
+
     def function(self, source, *call_args):  # source ignored
         return call_args[0]
 
@@ -267,6 +429,7 @@ class CoerceType(Transformation):
     A base class for transformations that use basic Python type coercion
 
     """
+    __slots__ = ()
 
     null_types = (None,)
 
@@ -281,11 +444,47 @@ class CoerceType(Transformation):
         return self.target_type(value)
 
 
+def _is_stock_coercion(kind):
+    """
+    Is `kind` a CoerceType whose only customizations are its `target_type`
+    and `null_types`?
+
+    """
+    return (issubclass(kind, CoerceType) and
+            isinstance(kind.target_type, type) and
+            six.get_unbound_function(kind.function) is
+            six.get_unbound_function(CoerceType.function) and
+            six.get_unbound_function(kind.__call__) is
+            six.get_unbound_function(Transformation.__call__))
+
+
+def _coercion(kind, required=False):
+    """
+    A plain function that does to a value what a stock coercion `kind`
+    does to its argument.
+
+    """
+    target_type = kind.target_type
+    if required:
+        return target_type
+
+    null_types = kind.null_types
+
+    def coerce(value):
+        if value in null_types:
+            return value
+        return target_type(value)
+
+    return coerce
+
+
 class Int(CoerceType):
     """
     Coerce input to an integer
 
     """
+    __slots__ = ()
+
     target_type = int
 
 
@@ -294,6 +493,8 @@ class Num(CoerceType):
     Coerce input to a floating point number
 
     """
+    __slots__ = ()
+
     target_type = float
 
 
@@ -302,6 +503,8 @@ class Str(CoerceType):
     Coerce input to a unicode string
 
     """
+    __slots__ = ()
+
     target_type = unicode_type
 
     null_types = (None, "")
@@ -312,6 +515,8 @@ class Bool(CoerceType):
     Coerce input to a boolean
 
     """
+    __slots__ = ()
+
     target_type = bool
 
 
@@ -323,13 +528,26 @@ class Concat(Transformation):
         *args: strings to concatenate
         strict (bool, default False): if not strict, ignore None
     """
+    __slots__ = ('strict',)
+
     def __init__(self, *args, **kwargs):
         super(Concat, self).__init__(*args, **kwargs)
         self.strict = kwargs.get('strict', False)
+        if any(self._joins_alike(arg) for arg in args):
+            # a nested Concat that treats None the same way joins the same
+            # way too: splice its pieces in rather than calling it
+            self.args = tuple(chain.from_iterable(
+                arg.args if self._joins_alike(arg) else (arg,)
+                for arg in args))
+
+    def _joins_alike(self, arg):
+        return (type(arg) is Concat and
+                bool(arg.strict) == bool(self.strict))
 
     def function(self, source, *call_args):  # source ignored
-        if not self.strict:
-            call_args = [i for i in call_args if i]
+        if not self.strict and not all(call_args):
+            # falsey values are dropped; skip the filter when there are none
+            return "".join(filter(None, call_args))
         return "".join(call_args)
 
 
@@ -350,6 +568,8 @@ class Do(Transformation):
             callable. this callable is applied to the input generated by any
             transformations passed in the subsequent args
     """
+    __slots__ = ()
+
     def function(self, source, *call_args):  # source ignored
         return call_args[0](*call_args[1:])
 
@@ -359,8 +579,42 @@ class Chain(Transformation):
     Chain a list of iterables into a single list.
 
     """
+    __slots__ = ()
+
     def function(self, source, *call_args):
-        return list(chain(*call_args))
+        return list(chain.from_iterable(call_args))
+
+
+# datetimes are immutable, so a full ISO timestamp only needs parsing once.
+# looser strings aren't cached: dateutil fills in any missing parts from
+# today's date, so the same string can mean different dates on different days
+_PARSED_DATE_CACHE = {}
+_PARSED_DATE_CACHE_SIZE = 4096
+
+
+def _parse_date_string(value):
+    """
+    Parse a date-ish string, as is: any time zone is left to the caller.
+
+    """
+    if not is_iso_datetime(value):
+        return parse_date(value)
+
+    date = _PARSED_DATE_CACHE.get(value)
+    if date is not None:
+        return date
+
+    if _fromisoformat is not None:
+        try:
+            date = _fromisoformat(value)
+        except ValueError:  # ISO-ish, but more than it can handle
+            pass
+    if date is None:
+        date = parse_date(value)
+
+    if len(_PARSED_DATE_CACHE) < _PARSED_DATE_CACHE_SIZE:
+        _PARSED_DATE_CACHE[value] = date
+    return date
 
 
 class ParseDate(Transformation):
@@ -370,6 +624,8 @@ class ParseDate(Transformation):
     Args:
         tz (tzinfo): the time zone to assume if none supplied
     """
+    __slots__ = ()
+
     DEFAULT_TIMEZONE = utc
 
     @property
@@ -380,8 +636,8 @@ class ParseDate(Transformation):
         value = call_args[0]
         if isinstance(value, int):
             date = datetime.utcfromtimestamp(value)
-        elif isinstance(value, six.string_types):
-            date = parse_date(value)
+        elif isinstance(value, string_types):
+            date = _parse_date_string(value)
         else:
             raise TypeError("Could not parse %s" % value)
 
@@ -396,14 +652,15 @@ class DateToIsoString(Transformation):
     Turn a datetime into an ISO 8601 formatted string.
 
     """
+    __slots__ = ()
+
     null_types = (None,)
 
     def function(self, source, *call_args):  # source ignored
-        try:
-            value = call_args[0]
-            if not self.required and value in self.null_types:
-                return value
-            return value.isoformat()
-        except (IndexError, AttributeError):
-            raise ValueError("Not a datetime: %s" % (
-                call_args[0] if call_args else None))
+        value = call_args[0] if call_args else None
+        if call_args and not self.required and value in self.null_types:
+            return value
+        isoformat = getattr(value, 'isoformat', None)
+        if isoformat is None:
+            raise ValueError("Not a datetime: %s" % value)
+        return isoformat()
@@ -3,20 +3,25 @@ from unittest import TestCase
 import math
 
 from bfh import Schema, Mapping, GenericSchema
+from bfh.common import dedunder
 from bfh.exceptions import Invalid
+from bfh.interfaces import FieldInterface
 from bfh.fields import (
     ArrayField,
+    Field,
     IntegerField,
     NumberField,
     Subschema,
     UnicodeField
 )
 from bfh.transformations import (
+    Chain,
     Const,
     Concat,
     Do,
     Get,
     Int,
+    Num,
     Str,
 )
 
@@ -75,6 +80,18 @@ class TestSchemas(TestCase):
         assert s.my_int == some_int
         assert s.another_str == another_str
 
+    def test_can_initialize_from_values(self):
+        self.assertEqual(("another_str", "my_int", "my_str"),
+                         Schema1._field_names)
+        s = Schema1.from_values(u'meow', 9, u'woof')
+        self.assertEqual(
+            Schema1(my_str=u'woof', my_int=9, another_str=u'meow').serialize(),
+            s.serialize())
+
+        ship = Ship.from_values({"first_name": u"Owen"}, u"Essex")
+        assert isinstance(ship.captain, Person)
+        self.assertEqual(u"Owen", ship.captain.first_name)
+
     def test_can_initialize_names(self):
         some_str = u'woof'
         some_int = 9
@@ -191,6 +208,59 @@ class TestSchemas(TestCase):
         result = Conversation(numbers=False).serialize(implicit_nulls=True)
         self.assertEqual({"numbers": False}, result)
 
+    def test_serializes_anything_with_serialize(self):
+        class Point(object):
+            def serialize(self, implicit_nulls=False):
+                return [1, 2]
+
+        class Plot(Schema):
+            point = Field()
+
+        self.assertEqual({"point": [1, 2]}, Plot(point=Point()).serialize())
+
+        class Blank(object):
+            pass
+
+        blank = Blank()
+        blank.serialize = lambda implicit_nulls=False: "set on the instance"
+        self.assertEqual({"point": "set on the instance"},
+                         Plot(point=blank).serialize())
+        self.assertEqual({"point": ["set on the instance"]},
+                         GenericSchema(point=[blank]).serialize())
+
+        class Proxy(object):
+            def __getattr__(self, name):
+                if name == "serialize":
+                    return lambda implicit_nulls=False: "proxied"
+                raise AttributeError(name)
+
+        self.assertEqual({"point": "proxied"}, Plot(point=Proxy()).serialize())
+
+    def test_can_use_a_bare_field_interface(self):
+        class Bare(FieldInterface):
+            def validate(self, value):
+                return True
+
+            def serialize(self, value, implicit_nulls=True):
+                return value
+
+        class Holder(Schema):
+            thing = Bare()
+
+        holder = Holder(thing=1)
+        assert holder.validate()
+        self.assertEqual({"thing": 1}, holder.serialize())
+
+    def test_required_can_change_after_definition(self):
+        class Late(Schema):
+            number = IntegerField(required=False)
+
+        assert Late().validate()
+
+        Late.number.required = True
+        with self.assertRaises(Invalid):
+            Late().validate()
+
     def test_subschema_implicit_nulls(self):
         """An empty subschema is an implicit null"""
         my_ship = {
@@ -283,6 +353,12 @@ class TestReservedWords(TestCase):
         assert s4.__if == 4
         assert s4.serialize() == {"if": 4}
 
+    def test_dedunder_only_strips_privacy_prefix(self):
+        self.assertEqual("if", dedunder("_Fancy__if"))
+        self.assertEqual("if", dedunder("if"))
+        self.assertEqual("__init__", dedunder("__init__"))
+        self.assertEqual("_raw_input", dedunder("_raw_input"))
+
     def test_can_get_dunder(self):
         class In(Schema):
             __finally = UnicodeField()
@@ -311,6 +387,33 @@ class TestReservedWords(TestCase):
         result = InToWhoa().apply({"finally": "it is here"})
         self.assertEqual(result.serialize(), {"lambda": "it is here"})
 
+    def test_custom_setattr_is_kept(self):
+        class Loud(Schema):
+            word = UnicodeField()
+
+            def __setattr__(self, name, value):
+                super(Loud, self).__setattr__(name, value.upper())
+
+        class Louder(Loud):
+            other = UnicodeField()
+
+        s = Louder()
+        s.word = "hey"
+        s.other = "you"
+        self.assertEqual({"word": "HEY", "other": "YOU"}, s.serialize())
+
+        built = Louder(word="hey", other="you")
+        self.assertEqual({"word": "HEY", "other": "YOU"}, built.serialize())
+
+        class Shout(Mapping):
+            target_schema = Louder
+
+            word = Get("said")
+            other = Get("back")
+
+        mapped = Shout().apply({"said": "hey", "back": "you"})
+        self.assertEqual({"word": "HEY", "other": "YOU"}, mapped.serialize())
+
 
 class TestGenericSchema(TestCase):
     def test_can_make_a_generic_schema_from_dict(self):
@@ -434,6 +537,88 @@ class TestMappings(TestCase):
         back_again = TwoToOne().apply(transformed).serialize()
         self.assertEqual(self.original, back_again)
 
+    def test_apply_many(self):
+        second = {"my_str": u"meow", "my_int": 4, "another_str": u"5"}
+        results = OneToTwo().apply_many([self.original, second])
+        self.assertEqual(
+            [self.expected, {"peas": u"meow", "carrots": 4, "beans": 5}],
+            [result.serialize() for result in results])
+
+        self.assertEqual([], OneToTwo().apply_many([]))
+
+        class Consistent(Mapping):
+            one = Const(1)
+
+        results = Consistent().apply_many([{}, {}])
+        self.assertEqual([{"one": 1}, {"one": 1}],
+                         [result.serialize() for result in results])
+
+    def test_apply_many_goes_blob_by_blob(self):
+        calls = []
+
+        class Logged(Mapping):
+            a = Do(lambda x: calls.append(("a", x)), Get("n"))
+            b = Do(lambda x: calls.append(("b", x)), Get("n"))
+
+        Logged().apply_many([{"n": 1}, {"n": 2}])
+        self.assertEqual([("a", 1), ("b", 1), ("a", 2), ("b", 2)], calls)
+
+    def test_gets_work_on_any_source(self):
+        class Bag(dict):
+            pass
+
+        class Thing(object):
+            my_str = u"attr"
+
+        class Loose(Mapping):
+            peas = Get("my_str")
+
+        self.assertEqual({"peas": u"dict"},
+                         Loose().apply({"my_str": u"dict"}).serialize())
+        self.assertEqual({"peas": u"bag"},
+                         Loose().apply(Bag(my_str=u"bag")).serialize())
+        self.assertEqual({"peas": u"attr"},
+                         Loose().apply(Thing()).serialize())
+        self.assertEqual({"peas": None}, Loose().apply({}).serialize())
+
+    def test_coercions_keep_their_nulls(self):
+        class Coerced(Mapping):
+            num = Int(Get("num"))
+            text = Str(Get("text"))
+
+        class Insistent(Mapping):
+            num = Int(Get("num"), required=True)
+
+        result = Coerced().apply({"num": "3", "text": ""})
+        self.assertEqual(3, result.num)
+        self.assertEqual("", result.text)
+
+        result = Coerced().apply({"num": None, "text": 5})
+        self.assertIsNone(result.num)
+        self.assertEqual(u"5", result.text)
+
+        self.assertEqual(3, Insistent().apply({"num": "3"}).num)
+        with self.assertRaises(TypeError):
+            Insistent().apply({})
+
+    def test_concats_in_mapping(self):
+        class Joined(Mapping):
+            label = Concat("id:", Get("id"), ":", Str(Get("num")))
+            loose = Concat(Get("id"), Get("missing"))
+
+        result = Joined().apply({"id": "abc", "num": 4})
+        self.assertEqual("id:abc:4", result.label)
+        self.assertEqual("abc", result.loose)
+
+    def test_chains_and_deep_gets_in_mapping(self):
+        class Deep(Mapping):
+            both = Chain(Get("a", "xs"), Get("ys"))
+            deep = Get("a", "b", default="none")
+
+        result = Deep().apply({"a": {"xs": [1, 2], "b": None}, "ys": (3,)})
+        self.assertEqual([1, 2, 3], result.both)
+        self.assertEqual("none", result.deep)
+
     def test_dont_even_need_schemas(self):
         """Schemas are really just to help you to keep your head straight"""
         transformed = OneToTwoBase().apply(self.original).serialize()
@@ -444,6 +629,8 @@ class TestMappings(TestCase):
             one = Const(1)
             two = Const("two")
             three = Const(3.0)
+            four = Concat("fo", "", "ur")
+            five = Str(Int(Num("5.0")))
 
         source = {
             "one": "doesn't",
@@ -457,8 +644,16 @@ class TestMappings(TestCase):
             "one": 1,
             "two": "two",
             "three": 3.0,
+            "four": "four",
+            "five": "5",
         }, transformed)
 
+        class Doomed(Mapping):
+            bad = Int("nope")
+
+        with self.assertRaises(ValueError):
+            Doomed().apply({})
+
     def test_empty_fields_serialize_as_none_valid_or_no(self):
         """We aren't making assumptions here. Call validate if you want it."""
         class FirstSchema(Schema):
@@ -534,6 +729,61 @@ class TestMappings(TestCase):
             transformed.serialize(implicit_nulls=True)
         )
 
+    def test_target_schema_property(self):
+        class Out(Schema):
+            x = IntegerField()
+
+        class Mymap(Mapping):
+            @property
+            def target_schema(self):
+                return Out
+
+            x = Get("y")
+
+        self.assertIsInstance(Mymap().apply({"y": 1}), Out)
+        many = Mymap().apply_many([{"y": 1}, {"y": 2}])
+        self.assertEqual([Out, Out], [type(out) for out in many])
+        self.assertEqual([1, 2], [out.x for out in many])
+
+    def test_source_schema_property(self):
+        class In(Schema):
+            x = IntegerField(default=7)
+
+        class Mymap(Mapping):
+            @property
+            def source_schema(self):
+                return In
+
+            x = Get("x")
+
+        self.assertEqual({"x": 7}, Mymap().apply({}).serialize())
+        self.assertEqual(
+            [{"x": 7}, {"x": 1}],
+            [out.serialize() for out in Mymap().apply_many([{}, {"x": 1}])]
+        )
+
+    def test_schemas_can_be_reassigned(self):
+        class In(Schema):
+            x = IntegerField(default=7)
+
+        class Out(Schema):
+            x = IntegerField()
+
+        class Mymap(Mapping):
+            source_schema = None
+
+            x = Get("x")
+
+        self.assertIsInstance(Mymap().apply({"x": 1}), GenericSchema)
+
+        Mymap.target_schema = Out
+        self.assertIsInstance(Mymap().apply({"x": 1}), Out)
+
+        mapping = Mymap()
+        mapping.source_schema = In
+        self.assertEqual({"x": 7}, mapping.apply({}).serialize())
+        self.assertEqual({"x": None}, Mymap().apply({}).serialize())
+
 
 class TestInheritance(TestCase):
     """Verify that the metaprogramming tricks didn't go awry"""
@@ -553,6 +803,49 @@ class TestInheritance(TestCase):
         assert hasattr(s, "turnips")
         assert "turnips" in s._fields
 
+    def test_subclass_can_shadow_field(self):
+        class SchemaA(Schema):
+            peas = IntegerField()
+            turnips = IntegerField()
+
+        class SchemaB(SchemaA):
+            peas = UnicodeField()
+            turnips = None
+
+        assert isinstance(SchemaB._fields["peas"], UnicodeField)
+        assert "turnips" not in SchemaB._fields
+        assert isinstance(SchemaA._fields["turnips"], IntegerField)
+
+    def test_custom_init_can_call_super(self):
+        class SchemaA(Schema):
+            peas = IntegerField()
+
+        class SchemaB(SchemaA):
+            turnips = IntegerField()
+
+            def __init__(self, **kwargs):
+                self.greeted = True
+                super(SchemaB, self).__init__(**kwargs)
+
+        s = SchemaB(peas=1, turnips=2, unknown=3)
+        assert s.greeted
+        self.assertEqual({"peas": 1, "turnips": 2}, s.serialize())
+
+    def test_custom_serialize_is_inherited(self):
+        class SchemaA(Schema):
+            peas = IntegerField()
+
+            def serialize(self, implicit_nulls=False):
+                out = super(SchemaA, self).serialize(implicit_nulls)
+                out["counted"] = True
+                return out
+
+        class SchemaB(SchemaA):
+            turnips = IntegerField(default=5)
+
+        self.assertEqual({"peas": 1, "turnips": 5, "counted": True},
+                         SchemaB(peas=1).serialize())
+
     def test_mappings_can_inherit(self):
         class SchemaA(Schema):
             beans = IntegerField()
@@ -591,6 +884,21 @@ class TestInheritance(TestCase):
         result = m.apply(source).serialize()
         self.assertEqual(expected, result)
 
+    def test_custom_apply_is_inherited(self):
+        class Shouting(Mapping):
+            word = Get('word')
+
+            def apply(self, blob):
+                result = super(Shouting, self).apply(blob)
+                result.word = result.word.upper()
+                return result
+
+        class LoudShouting(Shouting):
+            other = Get('other')
+
+        result = LoudShouting().apply({"word": "hey", "other": "you"})
+        self.assertEqual({"word": "HEY", "other": "you"}, result.serialize())
+
 
 class SquarePeg(Schema):
     id = IntegerField()
@@ -95,6 +95,26 @@ class TestFieldValidation(TestCase):
         with self.assertRaises(Invalid):
             field.validate("hiya")
 
+        assert field.validate(list(range(1000)))
+        assert field.validate([True] + list(range(1000)))  # bools are ints
+
+        with self.assertRaises(Invalid):
+            field.validate(list(range(1000)) + ["a"])
+
+        field = ArrayField(IntegerField())
+
+        assert field.validate([1, 2, 3])
+
+        with self.assertRaises(Invalid):
+            field.validate([1, "a"])
+
+        class Grumpy(IntegerField):
+            def validate(self, value):
+                return False
+
+        with self.assertRaises(Invalid):
+            ArrayField(Grumpy()).validate([1, 2])
+
         field = ArrayField(int, required=False)
 
         assert field.validate([1, 2, 3])
@@ -229,6 +249,18 @@ class TestFieldValidation(TestCase):
         with self.assertRaises(Invalid):
             field.validate("not a date string")
 
+        with self.assertRaises(Invalid):
+            field.validate("2015-10-11 00:00:00")
+
+        with self.assertRaises(Invalid):
+            field.validate("2015-1O-11T00:00:00")
+
+        with self.assertRaises(Invalid):
+            field.validate("2015-10-11T00:00")
+
+        with self.assertRaises(Invalid):
+            field.validate(u"2016-01-0\xb2T00:00:00")
+
         with self.assertRaises(Invalid):
             field.validate(1)
 
@@ -266,6 +298,13 @@ class TestFieldSerialization(TestCase):
         self.assertEqual([{"wat": None}, {"wat": None}],
                          field.serialize(source, implicit_nulls=False))
 
+        class LoudArrayField(ArrayField):
+            def _flatten(self, value, implicit_nulls=True):
+                return value.upper()
+
+        field = LoudArrayField(six.text_type)
+        self.assertEqual([u"X", u"Y"], field.serialize([u"x", u"y"]))
+
     def test_object_serialization(self):
         field = ObjectField()
 
@@ -365,6 +404,22 @@ class TestDefaultValuesForField(TestCase):
         self.assertEqual(my2.foo, {"wow": 1})
         self.assertEqual(my1.foo, {"wow": 2})
 
+    def test_overridden_default(self):
+        class Fixed(UnicodeField):
+            @property
+            def default(self):
+                return u"always"
+
+            @default.setter
+            def default(self, value):
+                pass
+
+        class FirstSchema(Schema):
+            foo = Fixed(required=False)
+
+        self.assertEqual(u"always", FirstSchema().foo)
+        self.assertEqual({"foo": u"always"}, FirstSchema().serialize())
+
     def test_callable_as_default(self):
 
         def test_callable():
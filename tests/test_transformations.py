@@ -211,6 +211,35 @@ class TestGet(TestCase):
         with self.assertRaises(Missing):
             Get("other", required=True)(my_dict)
 
+    def test_nested_defaults_and_misses(self):
+        class MyObj(object):
+            path = {"deep": None}
+        self.assertEqual("fallback",
+                         Get("path", "deep", default="fallback")(MyObj()))
+        self.assertIsNone(Get("path", "deep", "deeper")(MyObj()))
+        with self.assertRaises(Missing):
+            Get("path", "deeper", required=True)(MyObj())
+
+    def test_can_change_after_creation(self):
+        get = Get("path")
+        get.path = ("other",)
+        self.assertEqual("here", get({"other": "here"}))
+
+        get.default = "fallback"
+        self.assertEqual("fallback", get({}))
+
+        get.required = True
+        with self.assertRaises(Missing):
+            get({})
+
+    def test_overridden_function_is_used(self):
+        class Shouty(Get):
+            def function(self, source, path=None):
+                return super(Shouty, self).function(source, path).upper()
+
+        self.assertEqual("HEY", Shouty("a")({"a": "hey"}))
+        self.assertEqual("HEY", Shouty("a", "b")({"a": {"b": "hey"}}))
+
 
 class TestCoerce(TestCase):
     def test_can_coerce_int(self):
@@ -279,6 +308,15 @@ class TestConcat(TestCase):
         result = Concat(first, Concat(second, third))()
         self.assertEqual(first + second + third, result)
 
+    def test_nested_concat_keeps_its_strictness(self):
+        flat = Concat("a", Concat(Get("x"), "c"))
+        self.assertEqual(3, len(flat.args))
+        self.assertEqual("ac", flat({"x": None}))
+
+        strict = Concat("a", Concat(Get("x"), "c"), strict=True)
+        self.assertEqual(2, len(strict.args))
+        self.assertEqual("ac", strict({"x": None}))
+
     def test_none_behavior(self):
         result = Concat(None, "alone")()
         self.assertEqual("alone", result)
@@ -355,6 +393,7 @@ class TestParseDate(TestCase):
             u'1982-08-12T10:00:00',
             u'1982-08-12T10:00:00Z',
             u'1982-08-12T06:00:00-04:00',
+            u'1982-08-12T10:00:00.000000+00:00',
             "Fri Aug 12 10:00:00 +0000 1982",
             "Friday, August 12, 1982, 10AM UTC"
         ]
@@ -520,6 +559,19 @@ class TestSubmapping(TestCase):
             self.assertEqual({}, Outer().apply(source).serialize(implicit_nulls=True))
             self.assertEqual({}, OuterNoschema().apply(source).serialize(implicit_nulls=True))
 
+    def test_submapping_is_built_with_the_mapping(self):
+        """The submapping is instantiated once, when it is declared"""
+        class Broken(Mapping):
+            def __init__(self):
+                raise ValueError("no")
+
+        with self.assertRaises(ValueError):
+            class Outer(Mapping):
+                inner = Submapping(Broken, Get("inner"))
+
+        with self.assertRaises(ValueError):
+            ManySubmap(Broken, Get("inner"))
+
 
 class TestIdempotence(TestCase):
     def test_idempotent(self):
@@ -575,6 +627,16 @@ class TestMany(TestCase):
         transformed = Simpler().apply(source).serialize(implicit_nulls=True)
         self.assertEqual(expected, transformed)
 
+    def test_many_coercions(self):
+        self.assertEqual(Many(Int, Get('x'))({'x': ["1", 2.5]}), [1, 2])
+        self.assertEqual(Many(Str, Get('x'))({'x': [1, ""]}), ["1", ""])
+
+        class Doubled(Int):
+            def function(self, source, *call_args):
+                return 2 * super(Doubled, self).function(source, *call_args)
+
+        self.assertEqual(Many(Doubled, Get('x'))({'x': ["1", 2]}), [2, 4])
+
     def test_many_submap(self):
 
         class Sub(Mapping):